@@ -0,0 +1,222 @@
+"""Tests for wordlist_spider."""
+
+import asyncio
+import contextlib
+import json
+import socket
+from collections import Counter
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+import wordlist_spider
+from wordlist_spider import IgnoreListManager, OutputManager, TextProcessor, WebSpider
+
+IGNORE_FILE = str(Path(__file__).resolve().parent.parent / 'ignore_words.txt')
+
+
+@contextlib.asynccontextmanager
+async def serve(handler):
+    """Serve every path with handler on a local port and yield the base URL."""
+    app = web.Application()
+    app.router.add_route('GET', '/{tail:.*}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    try:
+        yield f"http://127.0.0.1:{runner.addresses[0][1]}"
+    finally:
+        await runner.cleanup()
+
+
+async def run_with_session(spider, coro_fn):
+    """Run coro_fn() with an open session on spider, as crawl_website does."""
+    async with aiohttp.ClientSession() as session:
+        spider.session = session
+        return await coro_fn()
+
+
+def make_spider():
+    return WebSpider(IgnoreListManager(IGNORE_FILE), delay=0, quiet=True)
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def load_robots_with(statuses, body=''):
+    """Load robots.txt from a server answering with each status in turn; return (parser, hits)."""
+    hits = []
+    
+    async def handler(request):
+        hits.append(request.path)
+        status = statuses[min(len(hits), len(statuses)) - 1]
+        return web.Response(status=status, text=body if status == 200 else '')
+    
+    async def main():
+        async with serve(handler) as base:
+            spider = make_spider()
+            robots = await run_with_session(spider, lambda: spider.load_robots(base + '/'))
+            return robots, base
+    
+    robots, base = asyncio.run(main())
+    return robots, base, hits
+
+
+def test_decode_body_undeclared_latin1_keeps_words_whole():
+    body = bytearray('<p>gewöhnlich</p>'.encode('latin-1'))
+    text = WebSpider.decode_body(body, None)
+    assert text == '<p>gewöhnlich</p>'
+    # A non-ASCII word is dropped whole instead of being split into 'gew' and 'hnlich'
+    assert list(TextProcessor(IgnoreListManager(IGNORE_FILE)).iter_words(text)) == []
+
+
+def test_decode_body_meta_charset():
+    body = bytearray('<meta charset="windows-1251"><p>Привет</p>'.encode('cp1251'))
+    assert 'Привет' in WebSpider.decode_body(body, None)
+
+
+def test_decode_body_meta_http_equiv_charset():
+    html = '<meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1"><p>café</p>'
+    assert 'café' in WebSpider.decode_body(bytearray(html.encode('latin-1')), None)
+
+
+def test_decode_body_header_charset_wins():
+    body = bytearray('<meta charset="utf-8"><p>naïve</p>'.encode('latin-1'))
+    assert 'naïve' in WebSpider.decode_body(body, 'iso-8859-1')
+
+
+def test_decode_body_undeclared_utf8():
+    body = bytearray('<p>naïve</p>'.encode('utf-8'))
+    assert WebSpider.decode_body(body, None) == '<p>naïve</p>'
+
+
+def test_decode_body_unknown_charset_falls_back():
+    assert WebSpider.decode_body(bytearray(b'<p>plain</p>'), 'no-such-charset') == '<p>plain</p>'
+
+
+def test_decode_body_failing_codec_falls_back():
+    # Real codecs that raise even with errors='replace' must not abort the crawl
+    for charset in ('idna', 'undefined', 'punycode'):
+        body = bytearray(f'<meta charset="{charset}"><p>caf\xe9</p>'.encode('latin-1'))
+        assert 'café' in WebSpider.decode_body(body, None)
+        assert 'café' in WebSpider.decode_body(body, charset)
+
+
+def test_load_robots_200_applies_rules(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    robots, base, hits = load_robots_with([200], 'User-agent: *\nDisallow: /private\n')
+    assert hits == ['/robots.txt']
+    assert robots.can_fetch('*', base + '/public')
+    assert not robots.can_fetch('*', base + '/private/page')
+
+
+def test_load_robots_404_allows_all(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    robots, base, hits = load_robots_with([404])
+    assert len(hits) == 1
+    assert robots.can_fetch('*', base + '/anything')
+
+
+def test_load_robots_401_403_disallow_all(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    for status in (401, 403):
+        robots, base, hits = load_robots_with([status])
+        assert len(hits) == 1
+        assert not robots.can_fetch('*', base + '/')
+
+
+def test_load_robots_persistent_5xx_disallows_all_after_retries(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    robots, base, hits = load_robots_with([503])
+    assert len(hits) == wordlist_spider.RETRY_TOTAL + 1
+    assert not robots.can_fetch('*', base + '/')
+
+
+def test_load_robots_transient_5xx_is_retried(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    robots, base, hits = load_robots_with([503, 200], 'User-agent: *\nDisallow: /private\n')
+    assert len(hits) == 2
+    assert robots.can_fetch('*', base + '/public')
+    assert not robots.can_fetch('*', base + '/private')
+
+
+def test_load_robots_unreachable_disallows_all(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    base = f"http://127.0.0.1:{unused_port()}"
+    spider = make_spider()
+    robots = asyncio.run(run_with_session(spider, lambda: spider.load_robots(base + '/')))
+    assert not robots.can_fetch('*', base + '/')
+
+
+def fetch_with(statuses):
+    """fetch_page from a server answering with each status in turn; return (result, hits)."""
+    hits = []
+    
+    async def handler(request):
+        hits.append(request.path)
+        status = statuses[min(len(hits), len(statuses)) - 1]
+        if status == 200:
+            return web.Response(text='<html><body>hello</body></html>', content_type='text/html')
+        return web.Response(status=status)
+    
+    async def main():
+        async with serve(handler) as base:
+            spider = make_spider()
+            return await run_with_session(spider, lambda: spider.fetch_page(base + '/page'))
+    
+    return asyncio.run(main()), hits
+
+
+def test_fetch_page_retries_429_and_5xx(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    for status in sorted(wordlist_spider.RETRY_STATUSES):
+        html, hits = fetch_with([status, status, 200])
+        assert html == '<html><body>hello</body></html>'
+        assert len(hits) == 3
+
+
+def test_fetch_page_gives_up_after_retries(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    html, hits = fetch_with([500])
+    assert html is None
+    assert len(hits) == wordlist_spider.RETRY_TOTAL + 1
+
+
+def test_fetch_page_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(wordlist_spider, 'RETRY_BACKOFF', 0)
+    html, hits = fetch_with([404])
+    assert html is None
+    assert hits == ['/page']
+
+
+def test_save_json_streamed_matches_pretty(tmp_path):
+    word_counts = Counter({'spider': 3, 'naïve': 2, 'quote"word': 1})
+    page_word_counts = {
+        'http://example.com/': {'spider': 2, 'naïve': 2},
+        'http://example.com/a?q="x"': {'spider': 1, 'quote"word': 1},
+        'http://example.com/empty': {},
+    }
+    visited_urls = set(page_word_counts)
+    
+    compact, pretty = tmp_path / 'compact.json', tmp_path / 'pretty.json'
+    OutputManager._save_json(word_counts, page_word_counts, str(compact), visited_urls)
+    OutputManager._save_json(word_counts, page_word_counts, str(pretty), visited_urls, pretty=True)
+    
+    assert '\n' not in compact.read_text(encoding='utf-8')
+    assert json.loads(compact.read_text(encoding='utf-8')) == json.loads(pretty.read_text(encoding='utf-8'))
+
+
+def test_save_json_streamed_without_pages(tmp_path):
+    compact = tmp_path / 'compact.json'
+    OutputManager._save_json(Counter(), {}, str(compact), set())
+    assert json.loads(compact.read_text(encoding='utf-8')) == {
+        'summary': {'total_pages': 0, 'total_unique_words': 0, 'total_word_occurrences': 0},
+        'overall_word_counts': {},
+        'page_word_counts': {},
+        'visited_urls': [],
+    }